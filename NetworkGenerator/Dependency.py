@@ -22,13 +22,14 @@ class Dependency:
 
     # Variable definitions #
 
-    __predecessor_frame = None                  # Predecessor frame id number
-    __predecessor_link = None                   # Predecessor link id number (must be end of the path)
-    __successor_frame = None                    # Successor frame id number
-    __successor_link = None                     # Successor link id number (must be end of the path)
-    __waiting_time = None                       # Time for the successor frame to wait after the predecessor frame
-    # 0 => no waiting time
-    __deadline_time = None                      # Time that the successor frame has to be received after the predecessor
+    # The variables are declared in slots, so the dependencies do not need a dictionary for their attributes
+    __slots__ = ('__predecessor_frame',         # Predecessor frame id number
+                 '__predecessor_link',          # Predecessor link id number (must be end of the path)
+                 '__successor_frame',           # Successor frame id number
+                 '__successor_link',            # Successor link id number (must be end of the path)
+                 '__waiting_time',              # Time for the successor frame to wait after the predecessor frame
+                 # 0 => no waiting time
+                 '__deadline_time')             # Time that the successor frame has to be received after the predecessor
     # 0 => no deadline time
 
     # Standard function definitions #
@@ -17,14 +17,16 @@ from NetworkGenerator.Node import *
 from NetworkGenerator.Dependency import *
 from NetworkGenerator.Frame import *
 from NetworkGenerator.Link import *
-from random import random, choice, shuffle, randint
+from random import random, choice, choices, sample, randint, randrange
 from copy import deepcopy
-from functools import reduce
+from functools import reduce, lru_cache
+from itertools import accumulate, islice
+from bisect import bisect_right
+from math import gcd
 from xml.dom import minidom
 import xml.etree.ElementTree as Xml
 import networkx as nx
 import logging
-import copy
 import os
 import shutil
 import hashlib
@@ -32,13 +34,6 @@ import hashlib
 
 # Auxiliary functions
 
-def gcd(a, b):
-    """Return greatest common divisor using Euclid's Algorithm."""
-    while b:
-        a, b = b, a % b
-    return a
-
-
 def lcm(a, b):
     """Return lowest common multiple."""
     return a * b // gcd(a, b)
@@ -284,6 +279,13 @@ class NetworkConfiguration:
 
         return True
 
+    def get_key(self):
+        """
+        Get a hashable key of the configuration, two configurations with the same parameters have the same key
+        :return: tuple with the name and value of all the parameters
+        """
+        return tuple((parameter, str(value)) for parameter, value in sorted(self.__dict__.items()))
+
     def __eq__(self, other):
         return self.__dict__ == other.__dict__
 
@@ -298,18 +300,41 @@ class Network:
 
     # Variable definitions #
 
-    __graph = None  # Network Graph built with the NetworkX package
-    __switches = []  # List with all the switches identifiers in the network
-    __end_systems = []  # List with all the end systems identifiers  in the network
-    __links = []  # List with all the links IDENTIFIERS in the network
-    __links_object_container = []  # List with all the links OBJECTS in the network (cannot be saved in graph)
-    __collision_domains = []  # Matrix with list of links that share the same wireless frequency
-    __paths = []  # Matrix with the number of end systems as index for x and y, it contains
-    # a list of links to describe the path from end system x to end system y, None if x = y
-    __aux_frames = []  # Auxiliary list with all frames in the network to help create dependencies
-    __frames = []  # List with all the frames OBJECTS in the network
-    __num_dependencies = 0  # Number of dependencies
-    __dependencies = []  # List of dependencies
+    # The variables are declared in slots, so the networks do not need a dictionary for their attributes
+    __slots__ = ('__graph',  # Network Graph built with the NetworkX package
+                 '__graph_nodes',  # List with the (node, attributes) of all nodes, to add them to the graph at once
+                 '__graph_edges',  # List with the (source, destination, attributes) of all edges, to add them to the
+                 # graph at once
+                 '__num_nodes',  # Number of nodes in the graph, counted when added to not ask the graph every time
+                 '__num_edges',  # Number of edges in the graph, counted when added to not ask the graph every time
+                 '__switches',  # Set with all the switches identifiers in the network
+                 '__end_systems',  # List with all the end systems identifiers  in the network
+                 '__links',  # List with all the links IDENTIFIERS in the network
+                 '__adjacency',  # List with the (neighbour node, index in the links list of the link to it) pairs of
+                 # every node
+                 '__links_object_container',  # List with all the links OBJECTS in the network (cannot be saved in
+                 # graph)
+                 '__link_speeds',  # List with the speed of every link, with the same index as the links objects
+                 '__link_types',  # List with the type of every link, with the same index as the links objects
+                 '__collision_domains',  # List with tuples of links that share the same wireless frequency
+                 '__paths',  # Matrix with the number of end systems as index for x and y, it contains
+                 # a tuple of links to describe the path from end system x to end system y, empty if x = y
+                 '__path_lengths',  # Matrix with the number of links of the path from end system x to end system y
+                 '__last_links',  # Matrix with the last link of the path from end system x to end system y,
+                 # None if x = y
+                 '__aux_frames',  # Auxiliary list with the indexes of all frames in the network to help create
+                 # dependencies
+                 '__aux_frames_buckets',  # Indexes of the auxiliary frames classified in lists by its (period,
+                 # deadline)
+                 '__bucket_positions',  # List with the position of every frame index in its bucket
+                 '__frame_buckets',  # List with the bucket of auxiliary frames with the same period and deadline of
+                 # every frame
+                 '__used_frames',  # Set with the indexes of the frames already selected as successors of a dependency
+                 '__frame_last_links',  # List with the tuple of last links of the paths to every receiver of every
+                 # frame
+                 '__frames',  # List with all the frames OBJECTS in the network
+                 '__num_dependencies',  # Number of dependencies
+                 '__dependencies')  # List of dependencies
 
     # Standard function definitions #
 
@@ -319,14 +344,28 @@ class Network:
         """
         logging.basicConfig(level=logging.DEBUG)
         self.__graph = nx.Graph()
-        self.__switches = []
+        self.__graph_nodes = []
+        self.__graph_edges = []
+        self.__num_nodes = 0
+        self.__num_edges = 0
+        self.__switches = set()
         self.__end_systems = []
         self.__links = []
+        self.__adjacency = []
         self.__links_object_container = []
+        self.__link_speeds = []
+        self.__link_types = []
         self.__collision_domains = []
         self.__paths = []
+        self.__path_lengths = []
+        self.__last_links = []
         self.__frames = []
         self.__aux_frames = []
+        self.__aux_frames_buckets = {}
+        self.__bucket_positions = []
+        self.__frame_buckets = []
+        self.__used_frames = set()
+        self.__frame_last_links = []
         self.__num_dependencies = 0
         self.__dependencies = []
 
@@ -337,18 +376,22 @@ class Network:
         Add a new switch into the network
         :return: None
         """
-        # Add into the Networkx graph a new node with type => object.switch node, id => switch number
-        self.__graph.add_node(self.__graph.number_of_nodes(), type=Node(NodeType.switch), id=len(self.__switches))
-        self.__switches.append(self.__graph.number_of_nodes() - 1)  # Save the identifier of Networkx
+        # Add for the Networkx graph a new node with type => object.switch node, id => switch number
+        self.__graph_nodes.append((self.__num_nodes, {'type': Node(NodeType.switch), 'id': len(self.__switches)}))
+        self.__switches.add(self.__num_nodes)  # Save the identifier of Networkx
+        self.__adjacency.append([])
+        self.__num_nodes += 1
 
     def __add_end_system(self):
         """
         Add a new end system into the network
         :return:
         """
-        # Add into the Networkx graph a new node with type => object.end_system node, id => end system number
-        self.__graph.add_node(self.__graph.number_of_nodes(), type=Node(NodeType.end_system), id=len(self.__switches))
-        self.__end_systems.append(self.__graph.number_of_nodes() - 1)  # Save the identifier of Networkx
+        # Add for the Networkx graph a new node with type => object.end_system node, id => end system number
+        self.__graph_nodes.append((self.__num_nodes, {'type': Node(NodeType.end_system), 'id': len(self.__switches)}))
+        self.__end_systems.append(self.__num_nodes)  # Save the identifier of Networkx
+        self.__adjacency.append([])
+        self.__num_nodes += 1
 
     def __add_link(self, source, destination, link_type=LinkType.wired, speed=100):
         """
@@ -359,17 +402,24 @@ class Network:
         :param speed: link speed
         :return: None
         """
-        # Add into the Networkx graph a new link between two node with type => object.link, id => link number
-        self.__graph.add_edge(source, destination, type=Link(speed=speed, link_type=link_type),
-                              id=self.__graph.number_of_edges() - 1)
+        # The link object is never modified once created, so the same one is shared by both directions and the graph
+        link = Link(speed=speed, link_type=link_type)
+
+        # Add for the Networkx graph a new link between two node with type => object.link, id => link number
+        self.__graph_edges.append((source, destination, {'type': link, 'id': self.__num_edges - 1}))
+        self.__num_edges += 1
+        self.__adjacency[source].append((destination, len(self.__links)))  # Saves the neighbours and the link indexes
+        self.__adjacency[destination].append((source, len(self.__links) + 1))
         self.__links.append([source, destination])  # Saves the same info in our link list with nodes
         self.__links.append([destination, source])
-        self.__links_object_container.append(Link(speed=speed, link_type=link_type))  # Saves the object with same index
-        self.__links_object_container.append(Link(speed=speed, link_type=link_type))
+        self.__links_object_container.extend((link, link))  # Saves the object with same index
+        self.__link_speeds.extend((speed, speed))  # Save the speed and type apart for the utilization calculation
+        self.__link_types.extend((link_type, link_type))
 
-    def __add_link_information(self, pre_col_dom, links, num_links, branch, parent_node):
+    def __add_link_information(self, col_dom_index, links, num_links, branch, parent_node):
         """
         Reads the link information and check if is needed to add it to the collision domain, then creates the link
+        :param col_dom_index: dictionary from the preprocessed link number to the collision domains that include it
         :param links: links description
         :param num_links: index of the number of links in the execution
         :param branch: branch to add the link
@@ -387,17 +437,15 @@ class Network:
             speed = 100
 
         # If the link is included in a collision domain, it is added to the collision domain matrix
-        for index_col, collision_domain in enumerate(pre_col_dom):
-            for index_link, link in enumerate(collision_domain):
-                # If the link is included in the collision domain preprocessed array, save it now with the
-                # correct link value now that we know it (both directions)
-                if pre_col_dom[index_col][index_link] == (num_links + branch) + 1:
-                    # The real number of link is the last added link, this information is in the graph
-                    self.__collision_domains[index_col].append((self.__graph.number_of_edges()) * 2)
-                    self.__collision_domains[index_col].append(((self.__graph.number_of_edges()) * 2) + 1)
+        # If the link is included in the collision domain preprocessed array, save it now with the correct link value
+        # now that we know it (both directions)
+        for index_col in col_dom_index.get((num_links + branch) + 1, ()):
+            # The real number of link is the last added link, this information is in the graph
+            self.__collision_domains[index_col].append(self.__num_edges * 2)
+            self.__collision_domains[index_col].append((self.__num_edges * 2) + 1)
 
         # Add the link with all the information
-        self.__add_link(parent_node, self.__graph.number_of_nodes() - 1, link_type, speed)
+        self.__add_link(parent_node, self.__num_nodes - 1, link_type, speed)
 
     def __change_switch_to_end_system(self, switch):
         """
@@ -405,58 +453,63 @@ class Network:
         :param switch: id of the switch
         :return: None
         """
-        self.__graph.node[switch]['type'] = Node(NodeType.end_system)  # Update the information into the graph
-        self.__graph.node[switch]['id'] = len(self.__end_systems)
+        # Update the information of the node for the graph, with a single access to its attributes
+        self.__graph_nodes[switch][1].update(type=Node(NodeType.end_system), id=len(self.__end_systems))
         self.__end_systems.append(switch)  # Update the information into our lists
-        self.__switches.remove(switch)
+        self.__switches.remove(switch)  # The switches are in a set, so removing it does not search all of them
 
-    def __recursive_create_network(self, description, pre_col_dom, links, parent_node, num_calls, num_links):
+    def __create_network(self, description, col_dom_index, links):
         """
-        Auxiliary recursive function for create network
+        Auxiliary function for create network, it walks the description with a stack of the switches that still have
+        branches to create instead of doing a recursive call per switch
         :param description: description of the network already parsed into integers
+        :param col_dom_index: dictionary from the preprocessed link number to the collision domains that include it
         :param links: list with description of the links parameters in tuples
-        :param parent_node: number of the parent node of the actual call
-        :param num_calls: number of calls that has been done to the function (to iterate the description string)
-        :param num_links: number of links that has been done to the function (to map the links in the correct order as
-        they are not correctly ordered in the links array for the perspective of the recursive function)
-        :return: the updated number of calls and the number of links to track correctly during the recursion
-        """
+        :return: the number of links and the number of calls done to walk the description, to check if the creation of
+        the network was successful
+        """
+        # Switches with branches still to create: [switch, number of branches, links when started, next branch]
+        pending_switches = []
+        parent_node = 0         # Number of the parent node of the actual description element
+        num_calls = 0           # Index of the actual element in the description
+        # Number of links to map the links in the correct order as they are not correctly ordered in the links array
+        num_links = 0
         try:  # Try to catch wrongly formulated network descriptions
-            if description[num_calls] < 0:  # Create new leads as end systems and link them to the parent node
-                # For all the new leafs, add the end system to the network and link it to the parent node
-                for leaf in range(abs(description[num_calls])):
-                    self.__add_end_system()
-                    self.__add_link_information(pre_col_dom, links, num_links, leaf, parent_node)
-                # Return subtracting the last links created by the last branch from the number of links, we want the
-                # number of links when the branch is starting, no after (due to recursion)
-                return num_links - int(description[num_calls]), num_calls
-
-            elif description[num_calls] == 0:  # Finished branch, change switch parent node into an end system
-                self.__change_switch_to_end_system(parent_node)
-                return num_links, num_calls  # Return as the branch is finished
-
-            elif description[num_calls] > 0:  # Create new branches with switches
-                it_links = num_links  # Save the starting number of links to iterate
-                last_call_link = 0  # Create variable to save the last link that was call (to return after)
-
-                for branch in range(description[num_calls]):  # For all new branches, create the switch and link it
-                    self.__add_switch()
-                    new_parent = self.__graph.number_of_nodes() - 1  # Save the new parent node for later
-                    # Read all the information of the link and add it
-                    self.__add_link_information(pre_col_dom, links, num_links, branch, parent_node)
-
-                    # Check which link is calling, if last call is bigger, set it to last call
-                    if last_call_link > it_links + (int(description[num_calls]) - branch):
-                        links_to_call = last_call_link
-                    else:
-                        links_to_call = it_links + (int(description[num_calls] - branch))
-                    # Call the recursive for the new branch, we save the last call link to recover it when we return
-                    # after the branch created by this recursive call is finished
-                    last_call_link, num_calls = self.__recursive_create_network(description, pre_col_dom, links,
-                                                                                new_parent, num_calls + 1,
-                                                                                links_to_call)
-
-                return last_call_link, num_calls  # Return when all branches have been created and closed
+            while True:
+                if description[num_calls] < 0:  # Create new leads as end systems and link them to the parent node
+                    # For all the new leafs, add the end system to the network and link it to the parent node
+                    for leaf in range(abs(description[num_calls])):
+                        self.__add_end_system()
+                        self.__add_link_information(col_dom_index, links, num_links, leaf, parent_node)
+                    # Subtract the last links created by the last branch from the number of links, we want the
+                    # number of links when the branch is starting, no after
+                    last_call_link = num_links - int(description[num_calls])
+
+                elif description[num_calls] == 0:  # Finished branch, change switch parent node into an end system
+                    self.__change_switch_to_end_system(parent_node)
+                    last_call_link = num_links
+
+                else:  # Create new branches with switches, the switch waits in the stack until all are created
+                    pending_switches.append([parent_node, description[num_calls], num_links, 0])
+                    last_call_link = 0
+
+                # Go back to the last switch with branches still to create, closing all finished switches
+                while pending_switches and pending_switches[-1][3] == pending_switches[-1][1]:
+                    pending_switches.pop()
+                if not pending_switches:
+                    return last_call_link, num_calls
+
+                switch, number_branches, it_links, branch = pending_switches[-1]
+                pending_switches[-1][3] += 1
+                self.__add_switch()
+                new_parent = self.__num_nodes - 1  # Save the new parent node for later
+                # Read all the information of the link and add it
+                self.__add_link_information(col_dom_index, links, it_links, branch, switch)
+
+                # Check which link is calling, if last call is bigger, use the last call
+                parent_node = new_parent
+                num_links = max(last_call_link, it_links + (number_branches - branch))
+                num_calls += 1
 
         except IndexError:
             raise ValueError("The network description is wrongly formulated, there are open branches")
@@ -481,8 +534,11 @@ class Network:
         """
         # Copy the preprocessed collision domain before deleting it
         self.__init__()                     # Clean everything when creating a new topology
-        for _ in range(len(pre_col_dom)):   # Create the real collision domain matrix
+        col_dom_index = {}                  # Index the preprocessed links to find their collision domains at once
+        for index_col, collision_domain in enumerate(pre_col_dom):  # Create the real collision domain matrix
             self.__collision_domains.append([])
+            for link in collision_domain:
+                col_dom_index.setdefault(link, []).append(index_col)
         description_array = network_description.split(';')  # Separate the description string in an array
         description = [int(numeric_string) for numeric_string in description_array]  # Parse the string into int
         if link_description is not None:    # Separate also the link description if exist
@@ -490,43 +546,56 @@ class Network:
         else:
             links = None
 
-        # Start the recursive call with parent switch 0
+        # Start the creation with parent switch 0
         self.__add_switch()
         # Num links and num calls are auxiliary variables to map the order in which the links are created and to check
         # if the creation of the network was successful
-        num_links, num_calls = self.__recursive_create_network(description, pre_col_dom, links, 0, 0, 0)
+        num_links, num_calls = self.__create_network(description, col_dom_index, links)
 
         # Check if there are additional elements that should not be in the network
         if num_calls != len(description) - 1:
             raise ValueError("The network description is wrongly formulated, there are extra elements")
 
+        # The collision domains are complete, so they are frozen to avoid modifying them after the creation
+        self.__collision_domains = [tuple(collision_domain) for collision_domain in self.__collision_domains]
+
+        # Build the Networkx graph at once with all the nodes and edges created
+        self.__graph.add_nodes_from(self.__graph_nodes)
+        self.__graph.add_edges_from(self.__graph_edges)
+
     def generate_paths(self):
         """
         Generate all the shortest paths from every end systems to every other end system
         Fills the 3 dimensions path matrix, first dimension is the sender, second dimension is the receiver,
-        third dimension is a list of INDEXES for the dataflow link list (not links ids, pointers to the link lists)
+        third dimension is a tuple of INDEXES for the dataflow link list (not links ids, pointers to the link lists)
+        Paths are not modified once generated, so they are saved as tuples, and all the pairs without path share the
+        same empty tuple instead of allocating an empty list for each of them
         :return: None
         """
-        for i in range(self.__graph.number_of_nodes()):  # Init the path 3-dimension matrix with empty arrays
-            self.__paths.append([])
-            for j in range(self.__graph.number_of_nodes()):
-                self.__paths[i].append([])
+        # Init the path 3-dimension matrix without paths
+        self.__paths = [[()] * self.__num_nodes for _ in range(self.__num_nodes)]
+        # The length and last link of the paths are saved apart, as they are the only information needed by the frames
+        # and dependencies generation
+        self.__path_lengths = [[0] * self.__num_nodes for _ in range(self.__num_nodes)]
+        self.__last_links = [[None] * self.__num_nodes for _ in range(self.__num_nodes)]
 
         # We iterate over all the senders and receivers
         for sender in self.__end_systems:
+            # Search the paths to all the nodes from the sender at once with a breadth first search over the adjacency
+            # lists, the path to every node is the path of the node that found it plus the link between them
+            sender_paths = {sender: ()}
+            queue = [sender]
+            for node in queue:  # The queue grows while it is iterated, until all nodes are found
+                for neighbour, link in self.__adjacency[node]:
+                    if neighbour not in sender_paths:
+                        sender_paths[neighbour] = sender_paths[node] + (link,)
+                        queue.append(neighbour)
             for receiver in self.__end_systems:
-                if sender != receiver:  # If they are not the same search the path
-                    # As the paths save the indexes, of the links, we need to search them with tuples of nodes, we then
-                    # iterate through all nodes find by the shortest path function of Networkx, and skip the first
-                    # iteration as we do not have a tuple of nodes yet
-                    first_iteration = False
-                    previous_node = None
-                    for node in nx.shortest_path(self.__graph, sender, receiver):  # For all nodes in the path
-                        if not first_iteration:
-                            first_iteration = True
-                        else:  # Find the index in the link list with the actual and previous node
-                            self.__paths[sender][receiver].append(self.__links.index([previous_node, node]))
-                        previous_node = node
+                if sender != receiver:  # If they are not the same save the path
+                    path = sender_paths[receiver]
+                    self.__paths[sender][receiver] = path
+                    self.__path_lengths[sender][receiver] = len(path)
+                    self.__last_links[sender][receiver] = path[-1]
 
     @staticmethod
     def __calculate_splits(paths):
@@ -538,33 +607,16 @@ class Network:
         """
         splits = []  # Matrix to save all the splits
         path_index = 0  # Horizontal index of the path matrix
-        split_index = 0  # Vertical index of the split matrix
-        first_path_flag = False  # Flag to identify a first found path
-        found_split_flag = False  # Flag to identify a split has been found
-        paths_left = len(paths)  # Paths left to be checked
-        while paths_left > 1:  # While we did not finish all different splits
-            paths_left = 0  # Initialize the paths left
-            for i in range(len(paths)):  # For all the different paths
-                try:  # The try is needed because a path ended will raise an exception
-                    if not first_path_flag:  # Check if it is the first path found
-                        first_split = paths[i][path_index]  # Save to compare with other paths to check new splits
-                        first_path_flag = True
-                    else:
-                        if paths[i][path_index] != first_split:  # If it is difference, a new split has been found
-                            if not found_split_flag:  # If is the first split, save both links
-                                splits.append([])
-                                splits[split_index].append(first_split)
-                                found_split_flag = True
-                            if paths[i][path_index] not in splits[split_index]:  # If the split is not in the list
-                                splits[split_index].append(paths[i][path_index])  # Save the link split
-                    paths_left += 1  # The path has not ended if no exception had been raised
-                except IndexError:  # If there is an exception, the path ended and we continue
-                    pass
-            if found_split_flag:  # If a split has been found
-                split_index += 1  # Increase the split index
-                found_split_flag = False
-            first_path_flag = False  # Update the path flags and the path index for next iteration
+        # Paths that have not ended yet in the current column, the ended paths are removed after every column so the
+        # next columns do not check them again
+        left_paths = [path for path in paths if path]
+        while len(left_paths) > 1:  # With less than two paths left there cannot be more splits
+            # Different links in the column, in the order they appear, if there is more than one, it is a split
+            split = list(dict.fromkeys(path[path_index] for path in left_paths))
+            if len(split) > 1:
+                splits.append(split)
             path_index += 1
+            left_paths = [path for path in left_paths if path_index < len(path)]
         return splits  # Return the filled splits matrix
 
     def generate_frames(self, number_frames, per_broadcast=1.0, per_single=0.0, per_locally=0.0, per_multi=0.0):
@@ -579,44 +631,43 @@ class Network:
         :param per_multi: percentage of frames to be send to a random number of end systems
         :return: None
         """
-        # Normalize the percentage so the sum is always 1.0
-        sum_per = float(per_broadcast + per_single + per_locally + per_multi)
-        per_broadcast /= sum_per
-        per_multi /= sum_per
-        per_locally /= sum_per
-        per_single /= sum_per
+        # Select the type and the sender end system of all the frames at once, the percentages are accumulated once
+        # into the thresholds of every type, so there is no need to normalize them
+        frame_types = choices(('broadcast', 'single', 'multi', 'locally'),
+                              cum_weights=tuple(accumulate((per_broadcast, per_single, per_multi, per_locally))),
+                              k=number_frames)
+        senders = choices(self.__end_systems, k=number_frames)
+        # The possible receivers of every sender are all end systems but the sender, calculated once per sender
+        # The receivers of the frames are not modified once generated, so they are saved as tuples that can be shared
+        other_end_systems = {sender: tuple(end_system for end_system in self.__end_systems if end_system != sender)
+                             for sender in set(senders)}
+        locally_receivers = {}  # Receivers with the minimum distance of every sender, found with its first local frame
 
         # Iterate for all the frames that needs to be created
-        for frame in range(number_frames):
-            frame_type = random()  # Generate random to see which type of frame is
-            sender = choice(self.__end_systems)  # Select the sender end system
+        for frame_type, sender in zip(frame_types, senders):
 
             # Select receivers depending of the frame type
-            if frame_type < per_broadcast:  # Broadcast frame
-                receivers = list(self.__end_systems)  # List of all end systems but the sender
-                receivers.remove(sender)
-
-            elif frame_type < per_broadcast + per_single:  # Single frame
-                receivers = list(self.__end_systems)  # Select single receiver that is not the sender
-                receivers.remove(sender)
-                receivers = [choice(receivers)]
-
-            elif frame_type < per_broadcast + per_single + per_multi:  # Multi frame
-                receivers = list(self.__end_systems)  # Select a random number of receivers
-                receivers.remove(sender)
-                shuffle(receivers)
-                num_receivers = randint(1, len(receivers))
-                receivers = receivers[0:num_receivers]
+            if frame_type == 'broadcast':  # Broadcast frame
+                receivers = other_end_systems[sender]  # All end systems but the sender, the tuple is shared
+
+            elif frame_type == 'single':  # Single frame
+                receivers = (choice(other_end_systems[sender]),)  # Select single receiver that is not the sender
+
+            elif frame_type == 'multi':  # Multi frame
+                # Select a random number of receivers, sampled without shuffling all the possible receivers
+                num_receivers = randint(1, len(other_end_systems[sender]))
+                receivers = tuple(sample(other_end_systems[sender], num_receivers))
 
             else:  # Locally frame
-                possible_receivers = list(self.__end_systems)
-                possible_receivers.remove(sender)
-                distances = [len(self.__paths[sender][receiver]) for receiver in possible_receivers]
-                min_distance = min(distance for distance in distances)  # Find the minimum distance
-                receivers = []
-                for receiver in possible_receivers:  # Copy receivers with min_distance
-                    if len(self.__paths[sender][receiver]) == min_distance:
-                        receivers.append(receiver)
+                receivers = locally_receivers.get(sender)
+                if receivers is None:  # The receivers of a sender are always the same, find them only the first time
+                    possible_receivers = other_end_systems[sender]
+                    distances = [self.__path_lengths[sender][receiver] for receiver in possible_receivers]
+                    min_distance = min(distances)  # Find the minimum distance
+                    # Copy receivers with min_distance, reusing the distances already calculated
+                    receivers = tuple(receiver for receiver, distance in zip(possible_receivers, distances)
+                                      if distance == min_distance)
+                    locally_receivers[sender] = receivers
 
             self.__frames.append(Frame(sender, receivers))  # Add the frame to the list of frames
 
@@ -629,119 +680,142 @@ class Network:
         :param sizes: list with sizes of the frames in bytes
         :return: None
         """
-        # Normalize percentages
-        per_periods = [float(per_period) / sum(per_periods) for per_period in per_periods]
+        # Normalize percentages, and accumulate them into the threshold of every period
+        total_per_periods = sum(per_periods)
+        thresholds = list(accumulate(float(per_period) / total_per_periods for per_period in per_periods))
 
-        # For all frames, add the new parameters
-        for i in range(len(self.__frames)):
-            type_period = random()
-            accumulate_period = 0
-            # For all possible periods
-            for j, per_period in enumerate(per_periods):
-                if type_period < per_period + accumulate_period:  # Choice one period for the frame
-                    self.__frames[i].set_period(periods[j])  # Set a period to the frame
-
-                    if deadlines is not None and deadlines[j] is not None:
-                        self.__frames[i].set_deadline(int(deadlines[j]))  # Set the deadline
-                    else:
-                        self.__frames[i].set_deadline(periods[j])  # If not, deadline = period
-
-                    if sizes is not None and sizes[j] is not None:  # If there are sizes, set it
-                        self.__frames[i].set_size(sizes[j])
-
-                    break  # Once selected, go out
-                else:
-                    accumulate_period += per_period  # If not, advance in the list
+        # The parameters of every period are the same for all the frames, so they are selected only once
+        params = []
+        for j, period in enumerate(periods):
+            if deadlines is not None and deadlines[j] is not None:
+                deadline = int(deadlines[j])  # Set the deadline
+            else:
+                deadline = period  # If not, deadline = period
+            size = sizes[j] if sizes is not None else None
+            params.append((period, deadline, size))
 
-    def __add_dependencies(self, number_dep, min_successor, max_successor, actual_depth, min_depth, max_depth,
-                           min_time_waiting, max_time_waiting, min_time_deadline, max_time_deadline, per_waiting,
-                           per_deadline, per_both, predecessor_frame_index, predecessor_link):
-        """
-        Fills the dependency tree from its root with a max depth and successors with a recursive function
+        # For all frames, add the new parameters
+        for frame in self.__frames:
+            # Choice one period for the frame, the first threshold bigger than the random value
+            j = bisect_right(thresholds, random())
+            if j < len(params):
+                period, deadline, size = params[j]
+                frame.set_period(period)  # Set a period to the frame
+                frame.set_deadline(deadline)
+                if size is not None:  # If there are sizes, set it
+                    frame.set_size(size)
+
+    def __remove_from_bucket(self, bucket, position):
+        """
+        Removes the frame index in the given position of a bucket of auxiliary frames, the last frame index of the
+        bucket is moved to its position so the rest of the bucket is not shifted
+        :param bucket: list of auxiliary frame indexes with the same period and deadline
+        :param position: position of the frame index to remove in the bucket
+        :return: the removed frame index
+        """
+        frame_index = bucket[position]
+        last_frame_index = bucket.pop()
+        if position < len(bucket):  # If the removed frame was not the last one, move the last one to its position
+            bucket[position] = last_frame_index
+            self.__bucket_positions[last_frame_index] = position
+        return frame_index
+
+    def __add_dependencies(self, number_dep, min_successor, max_successor, min_depth, max_depth, min_time_waiting,
+                           max_time_waiting, min_time_deadline, max_time_deadline, threshold_waiting,
+                           threshold_deadline, predecessor_frame_index, predecessor_link, stack):
+        """
+        Fills the dependency tree from its root with a max depth and successors, the tree is built in depth with a
+        stack of the dependencies that are still searching for successors instead of a recursive function
         :param number_dep: number of desired dependencies
         :param min_successor: min successor of dependencies at the tree
         :param max_successor: max successor of dependencies at the tree
-        :param actual_depth: depth of the dependency tree in this recursive call
         :param min_depth: min depth of dependencies at the tree
         :param max_depth: max depth of dependencies at the tree
         :param min_time_waiting: min time offset desired for waiting dependencies
         :param min_time_waiting: max time offset desired for waiting dependencies
         :param min_time_deadline: min time offset desired for deadline dependencies
         :param max_time_deadline: max time offset desired for deadline dependencies
-        :param per_waiting: percentage of waiting dependencies
-        :param per_deadline: percentage of deadline dependencies
-        :param per_both: percentage of both dependencies
-        :param predecessor_frame_index: index of the predecessor frame of the dependency
-        :param predecessor_link: index of the predecessor link of the dependency
+        :param threshold_waiting: random values below it create waiting dependencies
+        :param threshold_deadline: random values below it (and not below the waiting one) create deadline dependencies,
+        the rest create both dependencies
+        :param predecessor_frame_index: index of the predecessor frame of the root dependency
+        :param predecessor_link: index of the predecessor link of the root dependency
+        :param stack: empty list used as stack, it is shared by all the trees to avoid allocating a new one for each
         :return:
         """
-        # For all the successors of the predecessor frame, we find a successor frame and link it with a new dependency
-        for i in range(max_successor):
-            if len(self.__dependencies) == number_dep:  # If we generated enough dependencies, end
-                break
-            if len(self.__aux_frames) == 0:  # If we cannot generate more dependencies, end
-                break
+        # The random functions of the global generator are bound to locals, as they are called for every successor
+        draw, draw_choice, draw_randint, draw_randrange = random, choice, randint, randrange
+        # The same with the lists and dictionaries used for every successor, they are modified in place
+        aux_frames, frame_buckets = self.__aux_frames, self.__frame_buckets
+        used_frames, frame_last_links, dependencies = self.__used_frames, self.__frame_last_links, self.__dependencies
+
+        # Predecessors still searching successors: [predecessor frame index, predecessor link, depth, next successor]
+        stack.append([predecessor_frame_index, predecessor_link, 0, 0])
+        while stack:
+            predecessor_frame_index, predecessor_link, actual_depth, i = stack[-1]
+            # For all the successors of the predecessor frame, we find a successor frame and link it with a new
+            # dependency, once there are no more successors the predecessor is finished and removed from the stack
+            if i == max_successor:
+                stack.pop()
+                continue
+            if self.__num_dependencies == number_dep:  # If we generated enough dependencies, end the whole tree
+                stack.clear()
+                return
+            if not aux_frames:  # If we cannot generate more dependencies, end
+                stack.pop()
+                continue
+            stack[-1][3] += 1
             # If lord random wants a successor or we do not have more than the min successors, continue creating
-            if (i < min_successor) or (random() < ((max_successor - i) / max_successor)):
-
-                # Select the successor of the dependency with the SAME PERIOD and SAME DEADLINE
-                aux_aux_frames = copy.copy(self.__aux_frames)  # Copy the remaining frames, to easily select
-                successor_frame = choice(aux_aux_frames)  # Select a random frame
-                # While the randomly selected frame has not the same period, continue selecting a new one
-                while successor_frame.get_period() != self.__frames[predecessor_frame_index].get_period() and \
-                        len(aux_aux_frames) != 0 and successor_frame.get_deadline() != \
-                        self.__frames[predecessor_frame_index].get_deadline():
-                    aux_aux_frames.remove(successor_frame)
-                    # We try to select a new one if we fail to find the requirements, if we are out of index, no more
-                    # frames available and we end
-                    try:
-                        successor_frame = choice(aux_aux_frames)
-                    except IndexError:
-                        break
+            if (i < min_successor) or (draw() < ((max_successor - i) / max_successor)):
+
+                # Select the successor of the dependency with the SAME PERIOD and SAME DEADLINE, all the remaining
+                # frames that can be selected are in the bucket of the period and deadline of the predecessor
+                bucket = frame_buckets[predecessor_frame_index]
 
                 # If there is no more frames to search for a successor frame, we end
-                if len(aux_aux_frames) == 0:
-                    break
+                if not bucket:
+                    stack.pop()
+                    continue
 
-                successor_frame_index = self.__frames.index(successor_frame)
-                self.__aux_frames.remove(successor_frame)
+                # Select a random frame and remove it
+                successor_frame_index = self.__remove_from_bucket(bucket, draw_randrange(len(bucket)))
+                # Mark it as used instead of removing it from the auxiliary list, it will be skipped as root later
+                used_frames.add(successor_frame_index)
 
                 # Get the link of the successor
-                successor_sender = successor_frame.get_sender()
-                successor_receiver = choice(successor_frame.get_receivers())
-                successor_link = self.__paths[successor_sender][successor_receiver][-1]
-
-                # Get the waiting and/or deadline times
-                random_value = random()
-                if random_value < per_waiting:
-                    wait_time = randint(min_time_waiting, max_time_waiting)
-                    dead_time = 0
-                elif random_value < per_waiting + per_deadline:
+                successor_link = draw_choice(frame_last_links[successor_frame_index])
+
+                # Get the waiting and/or deadline times, waiting dependencies are below the waiting threshold, deadline
+                # dependencies between both thresholds and dependencies with both times over the deadline threshold
+                random_value = draw()
+                if random_value < threshold_waiting or random_value >= threshold_deadline:
+                    wait_time = draw_randint(min_time_waiting, max_time_waiting)
+                else:
                     wait_time = 0
-                    dead_time = randint(min_time_deadline, max_time_deadline)
+                if random_value >= threshold_waiting:
+                    dead_time = draw_randint(min_time_deadline, max_time_deadline)
                 else:
-                    wait_time = randint(min_time_waiting, max_time_waiting)
-                    dead_time = randint(min_time_deadline, max_time_deadline)
-
-                # Add the dependency
-                self.__dependencies.append(Dependency(predecessor_frame_index, predecessor_link, successor_frame_index,
-                                                      successor_link, wait_time, dead_time))
-
-                # If lord random wants more depth or the actual depth is smaller than the minimum depth
-                if (actual_depth < min_depth) or (random() < ((max_depth - actual_depth) / max_depth)):
-                    self.__add_dependencies(number_dep, min_successor, max_successor, actual_depth + 1, min_depth,
-                                            max_depth, min_time_waiting, max_time_waiting, min_time_deadline,
-                                            max_time_deadline, per_waiting, per_deadline, per_both,
-                                            successor_frame_index, successor_link)
+                    dead_time = 0
+
+                # Add the dependency in the next preallocated position
+                dependencies[self.__num_dependencies] = Dependency(predecessor_frame_index, predecessor_link,
+                                                                   successor_frame_index, successor_link, wait_time,
+                                                                   dead_time)
+                self.__num_dependencies += 1
+
+                # If lord random wants more depth or the actual depth is smaller than the minimum depth, the successor
+                # searches its own successors before the predecessor continues
+                if (actual_depth < min_depth) or (draw() < ((max_depth - actual_depth) / max_depth)):
+                    stack.append([successor_frame_index, successor_link, actual_depth + 1, 0])
             else:
-                break
+                stack.pop()
 
     def generate_dependencies(self, number_dep, min_successor, max_successor, min_depth, max_depth, min_time_waiting,
                               max_time_waiting, min_time_deadline, max_time_deadline, per_waiting, per_deadline,
                               per_both):
         """
         Generate the dependencies for a given array of frames. It generates roots of dependency trees and call a
-        recursive function to start building the tree.
+        function to start building the tree.
         It builds trees until the desired number of dependencies is accomplished or until no more dependencies can be
         created.
         It creates two different dependencies with different predefined ranges.
@@ -764,41 +838,69 @@ class Network:
         if number_dep == 0:
             return
 
-        # Normalize the percentage so the sum is always 1.0
-        sum_per = float(per_waiting + per_deadline + per_both)
-        per_waiting /= sum_per
-        per_deadline /= sum_per
-        per_both /= sum_per
-
-        # Copy all frames to the auxiliary list, so it is easier to find frames without dependencies
-        self.__aux_frames = copy.copy(self.__frames)
+        # Accumulate the percentages once into the thresholds used to select the type of every dependency, normalized
+        # so the sum is always 1.0 (the percentage of both dependencies is the rest up to 1.0)
+        inverse_sum_per = 1.0 / (per_waiting + per_deadline + per_both)
+        threshold_waiting = per_waiting * inverse_sum_per
+        threshold_deadline = (per_waiting + per_deadline) * inverse_sum_per
+
+        # Save the indexes of all frames in the auxiliary list in a random order, so it is easier to find frames without
+        # dependencies and the roots are drawn at once by taking the frames from the end of the list
+        self.__aux_frames = sample(range(len(self.__frames)), len(self.__frames))
+
+        # Also classify them by period and deadline, so successors are selected directly from the frames that match
+        self.__aux_frames_buckets = {}
+        self.__bucket_positions = []
+        self.__frame_buckets = []
+        self.__used_frames = set()
+        for frame_index, frame in enumerate(self.__frames):
+            bucket = self.__aux_frames_buckets.setdefault((frame.get_period(), frame.get_deadline()), [])
+            self.__bucket_positions.append(len(bucket))  # Save its position to remove it without searching it
+            self.__frame_buckets.append(bucket)  # Save its bucket by frame index, to find it without its parameters
+            bucket.append(frame_index)
+
+        # The link of a dependency is the last link of the path to one of the receivers of the frame, save them for all
+        # frames so selecting the link of a dependency is a single random choice
+        self.__frame_last_links = [tuple(self.__last_links[frame.get_sender()][receiver]
+                                         for receiver in frame.get_receivers()) for frame in self.__frames]
+
+        # Preallocate all the desired dependencies, the number of dependencies is the position to add the next one
+        self.__dependencies.extend([None] * (number_dep - self.__num_dependencies))
+
+        stack = []  # Stack to build the trees, it is always empty when a tree is finished
+        # Bind the lists and dictionaries used for every root to locals, they are modified in place
+        aux_frames, used_frames = self.__aux_frames, self.__used_frames
+        frame_buckets, bucket_positions, frame_last_links = (self.__frame_buckets, self.__bucket_positions,
+                                                             self.__frame_last_links)
 
         # While there are dependencies to make, or it is not possible to do more
-        while (len(self.__dependencies) < number_dep) and (len(self.__aux_frames) > 0):
-            # Choose predecessor frame and remove it from the frames list
-            predecessor_frame = choice(self.__aux_frames)
-            predecessor_frame_index = self.__frames.index(predecessor_frame)
-            self.__aux_frames.remove(predecessor_frame)
-
-            # Get sender and receivers to take the last link of its path
-            predecessor_sender = predecessor_frame.get_sender()
-            predecessor_receiver = choice(predecessor_frame.get_receivers())
-            predecessor_link = self.__paths[predecessor_sender][predecessor_receiver][-1]
-
-            # Call the recursive function to start building the tree from that root dependency
-            self.__add_dependencies(number_dep, min_successor, max_successor, 0, min_depth, max_depth, min_time_waiting,
-                                    max_time_waiting, min_time_deadline, max_time_deadline, per_waiting, per_deadline,
-                                    per_both, predecessor_frame_index, predecessor_link)
-            self.__num_dependencies = len(self.__dependencies)
+        while self.__num_dependencies < number_dep and aux_frames:
+            # Choose predecessor frame and remove it from the frames list, as they are already in a random order it is
+            # the last one, so there is no need to search it or shift the rest of the list
+            predecessor_frame_index = aux_frames.pop()
+            if predecessor_frame_index in used_frames:  # If it is already a successor, it cannot be a root
+                continue
+            self.__remove_from_bucket(frame_buckets[predecessor_frame_index], bucket_positions[predecessor_frame_index])
+
+            # Take the last link of the path to one of its receivers
+            predecessor_link = choice(frame_last_links[predecessor_frame_index])
+
+            # Start building the tree from that root dependency
+            self.__add_dependencies(number_dep, min_successor, max_successor, min_depth, max_depth, min_time_waiting,
+                                    max_time_waiting, min_time_deadline, max_time_deadline, threshold_waiting,
+                                    threshold_deadline, predecessor_frame_index, predecessor_link, stack)
+
+        del self.__dependencies[self.__num_dependencies:]  # Remove the preallocated positions not used
 
     @staticmethod
     def calculate_hyper_period(periods):
         """
         Calculates the hyper_period of the network
+        Repeated periods do not change the lcm, so only the different periods are reduced
         :param periods: list of periods to calculate the hyper_period
         :return: the hyper_period
         """
-        return lcm_multiple(*periods)
+        return lcm_multiple(*set(periods))
 
     def calculate_utilization(self, hyper_period, replicas, sensing_period, sensing_time):
         """
@@ -816,33 +918,30 @@ class Network:
 
         # For all frames in the network
         for frame in self.__frames:
-            # Get all the unique links in the paths of the frame
-            unique_links = []
+            # Get all the unique links in the paths of the frame, a set avoids searching the links already found
+            unique_links = set()
             for receiver in frame.get_receivers():
-                # For all links in the path
-                for link in self.__paths[frame.get_sender()][receiver]:
-                    if link not in unique_links:        # If is unique, add it
-                        unique_links.append(link)
+                unique_links.update(self.__paths[frame.get_sender()][receiver])  # Add all links in the path
 
             # Once we have all the links in the path, calculate the ns to transmit for all links
             for link in unique_links:
                 # First calculate the time occupied by normal transmissions and its period instances
                 link_utilization[link] += int(((frame.get_size() * 1000) /
-                                               self.__links_object_container[link].get_speed()) *
+                                               self.__link_speeds[link]) *
                                               (hyper_period / frame.get_period()))
 
                 # Then, add the retransmissions if the link has any
-                if self.__links_object_container[link].get_type() == LinkType.wireless:
+                if self.__link_types[link] == LinkType.wireless:
                     for index, collision_domain in enumerate(self.__collision_domains):
                         if link in collision_domain:
                             link_utilization[link] += int((((frame.get_size() * 1000) /
-                                                            self.__links_object_container[link].get_speed()) *
+                                                            self.__link_speeds[link]) *
                                                            (hyper_period / frame.get_period())) * replicas[index])
 
         # Last, add the time occupied by sensing and control
         if sensing_period is not None:
-            for index, link in enumerate(self.__links_object_container):
-                if link.get_type() == LinkType.wireless:
+            for index, link_type in enumerate(self.__link_types):
+                if link_type == LinkType.wireless:
                     link_utilization[index] += int((hyper_period / sensing_period) * sensing_time)
 
         # Now calculate the utilization in float for every link and calculate the total utilization of the network
@@ -859,6 +958,109 @@ class Network:
 
     # Input function definitions #
 
+    @staticmethod
+    def __read_xml(name):
+        """
+        Returns the root of the xml file, the file is only parsed again if it has been modified since the last read
+        :param name: name of the xml file
+        :return: root of the xml tree
+        """
+        # Open the file if exists, only the errors of reading or parsing the file are caught
+        try:
+            return Network.__parse_xml(name, os.path.getmtime(name))
+        except (OSError, Xml.ParseError) as error:
+            raise Exception("Could not read the xml file") from error
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def __parse_xml(name, modification_time):
+        """
+        Parses the xml file, the trees are cached as the getters are called with the same file for every configuration
+        :param name: name of the xml file
+        :param modification_time: last modification time of the file, so a modified file is parsed again
+        :return: root of the xml tree
+        """
+        return Xml.parse(name).getroot()
+
+    @staticmethod
+    def __find_xml(parent, path, index):
+        """
+        Returns the element in the given position of the path, walking the elements until it instead of building the
+        list with all of them
+        :param parent: xml element where to search the path
+        :param path: path of the elements
+        :param index: position of the element to return
+        :return: the xml element
+        """
+        try:
+            return next(islice(parent.iterfind(path), index, None))
+        except StopIteration:
+            raise IndexError('There is no element ' + path + ' in the position ' + str(index))
+
+    @staticmethod
+    def __get_topology_information_xml(name, index_network, tag, index):
+        """
+        Returns the element of the topology information of the given network, used by all the topology parameters
+        :param name: name of the xml file
+        :param index_network: position of the network in the xml to read
+        :param tag: tag of the parameter in the topology information
+        :param index: position of the parameter to read
+        :return: the xml element of the parameter
+        """
+        root = Network.__read_xml(name)  # Open the file if exists, it is only parsed the first time
+
+        # Position the branch to the network that is going to be read
+        network_description_xml = Network.__find_xml(root, 'NetworkGenerator/Topology', index_network)
+
+        # Read the parameter from the topology information
+        topology_information_xml = network_description_xml.find('TopologyInformation')
+        return Network.__find_xml(topology_information_xml, tag, index)
+
+    @staticmethod
+    def __get_topology_time_from_xml(name, index_network, tag, index, description):
+        """
+        Returns a time parameter of the topology information of the given network, changed to ns
+        :param name: name of the xml file
+        :param index_network: position of the network in the xml to read
+        :param tag: tag of the time parameter in the topology information
+        :param index: position of the time parameter to read
+        :param description: description of the time for the error message
+        :return: the time in ns
+        """
+        time_xml = Network.__get_topology_information_xml(name, index_network, tag, index)
+        return Network.__convert_time_xml(time_xml, description)
+
+    @staticmethod
+    def __convert_time_xml(time_xml, description):
+        """
+        Reads a time from the xml element and changes it from its unit to ns
+        :param time_xml: xml element with the time as text and the unit as attribute
+        :param description: description of the time for the error message
+        :return: the time in ns
+        """
+        time = int(time_xml.text)
+        try:  # Multiply the time by the ns that its unit has
+            return time * {'ns': 1, 'us': 1000, 'ms': 1000000, 's': 1000000000}[time_xml.attrib['unit']]
+        except KeyError:
+            raise TypeError('I do not know this unit for the ' + description + ' => ' + time_xml.attrib['unit'])
+
+    @staticmethod
+    def __convert_speed_xml(speed_xml):
+        """
+        Reads a speed from the xml element and changes it from its unit to MB/s
+        :param speed_xml: xml element with the speed as text and the unit as attribute
+        :return: the speed in MB/s (rounded down, as the speeds of the links are integers)
+        """
+        speed = int(speed_xml.text)
+        try:  # Multiply the speed by the KB/s that its unit has, so it is always an integer before changing to MB/s
+            speed = speed * {'KB/s': 1, 'MB/s': 1000, 'GB/s': 1000000}[speed_xml.attrib['unit']] // 1000
+        except KeyError:
+            raise TypeError('I do not know this unit for the speed => ' + speed_xml.attrib['unit'])
+        if speed <= 0:  # The links cannot be slower than 1 MB/s, as it is the unit used for all the links
+            raise ValueError('The speed of the link should be at least 1 MB/s')
+
+        return speed
+
     @staticmethod
     def get_network_topology_from_xml(name, index_network):
         """
@@ -868,27 +1070,22 @@ class Network:
         :return: array with network description, the preprocessed collision domain array and array with link 
         description (formatted to work in the network function)
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        root = Network.__read_xml(name)  # Open the file if exists, it is only parsed the first time
 
         # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
+        network_description_xml = Network.__find_xml(root, 'NetworkGenerator/Topology', index_network)
 
         # Read Initialize the number of collision domains from the topology information
         topology_information_xml = network_description_xml.find('TopologyInformation')
         num_collision_domains = int(topology_information_xml.find('NumberCollisionDomains').text)
 
-        collision_domains_preprocessed = []
-        for _ in range(num_collision_domains):  # For all the collision domains, add an empty list to the matrix
-            collision_domains_preprocessed.append([])
+        # For all the collision domains, add an empty list to the matrix. All of them are created, even the ones
+        # without links, as the number of collision domains and their positions are used later
+        collision_domains_preprocessed = [[] for _ in range(num_collision_domains)]
 
-        # Initialize strings to be returned with the description
-        network_description_line = ''
-        link_info_line = ''
+        # Initialize the lists with the parts of the strings to be returned with the description, joined at the end
+        network_description_parts = []
+        link_info_parts = []
         links_found = False
 
         # For all bifurcations in the topology, read the links information
@@ -896,55 +1093,48 @@ class Network:
         link = 0
         for bifurcation in network_description_xml.findall('Bifurcation'):
 
-            # Find the number of links in the bifurcation
-            network_description_line += bifurcation.find('NumberLinks').text + ';'
-            number_links = int(bifurcation.find('NumberLinks').text)
-            links_xml = bifurcation.find('Link')
-            links_counter = 0
+            # Find the number of links in the bifurcation, and all its links information only once
+            number_links_text = bifurcation.find('NumberLinks').text
+            network_description_parts.append(number_links_text)
+            number_links = int(number_links_text)
+            links_xml = bifurcation.findall('Link')
             links_found = False
 
             # See if there is also links description
-            if links_xml is not None:
+            if links_xml:
                 links_found = True
-                for link_xml in bifurcation.findall('Link'):  # For all links information
-                    links_counter += 1
-
+                for link_xml in links_xml:  # For all links information
                     # Save the type information and check if is correct
                     if link_xml.attrib['category'] == 'wired':
-                        link_info_line += 'w'
+                        link_category = 'w'
                     elif link_xml.attrib['category'] == 'wireless':
-                        link_info_line += 'x'
+                        link_category = 'x'
                     else:
                         raise TypeError('The type of the link is not wired neither wireless')
                     link += 1
 
                     # Save the speed of the link and convert it to MB/s (standard used in the Network Class)
-                    speed_xml = link_xml.find('Speed')
-                    speed = speed_xml.text
-                    if speed_xml.attrib['unit'] == 'KB/s':  # Convert the speed if is in KB/s
-                        speed /= 1000
-                    if speed_xml.attrib['unit'] == 'GB/s':  # Convert the speed if is in GB/s
-                        speed *= 1000
-                    link_info_line += str(speed) + ';'
-
-                    # Save the collision domain if there exist
-                    if link_xml.find('CollisionDomain') is not None:
-                        collision_domain_string = link_xml.find('CollisionDomain').text
-                        collision_domains = collision_domain_string.split(';')
-                        for collision_domain in collision_domains:  # For every collision domain in the link, save it
-                            collision_domains_preprocessed[int(collision_domain) - 1].append(link)
-
-            # Check if the number of links said by the bifurcation and the encounter links match
-            if abs(number_links) != links_counter:
-                logging.debug(number_links)
-                logging.debug(links_counter)
+                    speed = Network.__convert_speed_xml(link_xml.find('Speed'))
+                    link_info_parts.append(link_category + str(speed))
+
+                    # Save the collision domain if there exist, searching the element only once
+                    collision_domain_xml = link_xml.find('CollisionDomain')
+                    if collision_domain_xml is not None:
+                        # For every collision domain in the link, save it
+                        for collision_domain in map(int, collision_domain_xml.text.split(';')):
+                            collision_domains_preprocessed[collision_domain - 1].append(link)
+
+            # Check if the number of links said by the bifurcation and the encounter links match, all of them are
+            # read before so a wrong link is also detected
+            if abs(number_links) != len(links_xml):
+                logging.debug("Number of links => %d, links found => %d", abs(number_links), len(links_xml))
                 raise ValueError('The number of links is incorrect, they should be the same as the bifurcations')
 
         # Return the description string, and the link description string if exists
         if not links_found:
-            return network_description_line[0:-1], collision_domains_preprocessed, None
+            return ';'.join(network_description_parts), collision_domains_preprocessed, None
         else:
-            return network_description_line[0:-1], collision_domains_preprocessed, link_info_line[0:-1]
+            return ';'.join(network_description_parts), collision_domains_preprocessed, ';'.join(link_info_parts)
 
     @staticmethod
     def get_number_replicas_from_xml(name, index_network, index_replica):
@@ -955,26 +1145,10 @@ class Network:
         :param index_replica: index of the replica
         :return: list with the number of retransmissions
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
         # Read the replicas and convert it to a list
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        num_replica_xml = topology_information_xml.findall('NumberReplicas')[index_replica]
+        num_replica_xml = Network.__get_topology_information_xml(name, index_network, 'NumberReplicas', index_replica)
         # For all replicas in the list, we separate them by ";" and then add them to the list converting them to int
-        num_replicas = num_replica_xml.text.split(';')
-        list_replicas = []
-        for replica in num_replicas:
-            list_replicas.append(int(replica))
-
-        return list_replicas
+        return list(map(int, num_replica_xml.text.split(';')))
 
     @staticmethod
     def get_replica_policy_from_xml(name, index_network, index_policy):
@@ -985,21 +1159,8 @@ class Network:
         :param index_policy: policy index
         :return: the policy in string format
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
         # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        policy_xml = topology_information_xml.findall('ReplicaPolicy')[index_policy]
-
-        return policy_xml.text
+        return Network.__get_topology_information_xml(name, index_network, 'ReplicaPolicy', index_policy).text
 
     @staticmethod
     def get_replica_interval_from_xml(name, index_network, index_interval):
@@ -1010,35 +1171,9 @@ class Network:
         :param index_interval: interval index
         :return: the interval arrival time
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
-        # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        interval_xml = topology_information_xml.findall('ReplicaInterArrivalTime')[index_interval]
-        interval = int(interval_xml.text)
-        # Check the unit and change to fit us
-        if interval_xml.attrib['unit'] == 'ms':
-            interval *= 1000000
-        elif interval_xml.attrib['unit'] == 'ns':
-            interval = interval
-        elif interval_xml.attrib['unit'] == 's':
-            interval *= 1000000000
-        elif interval_xml.attrib['unit'] == 'us':
-            interval *= 1000
-        else:
-            raise TypeError('I do not know this unit for the interval arrival time between replicas => '
-                            + interval_xml.attrib['unit'])
-        interval = (int(interval))
-
-        return interval
+        # Read the time and change its unit to fit us
+        return Network.__get_topology_time_from_xml(name, index_network, 'ReplicaInterArrivalTime', index_interval,
+                                                    'interval arrival time between replicas')
 
     @staticmethod
     def get_minimum_time_switch_from_xml(name, index_network, index_minimum_switch):
@@ -1049,35 +1184,9 @@ class Network:
         :param index_minimum_switch: minimum time in switch index
         :return: the interval arrival time
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
-        # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        minimum_switch_xml = topology_information_xml.findall('MinTimeSwitch')[index_minimum_switch]
-        minimum_switch = int(minimum_switch_xml.text)
-        # Check the unit and change to fit us
-        if minimum_switch_xml.attrib['unit'] == 'ms':
-            minimum_switch *= 1000000
-        elif minimum_switch_xml.attrib['unit'] == 'ns':
-            minimum_switch = minimum_switch
-        elif minimum_switch_xml.attrib['unit'] == 's':
-            minimum_switch *= 1000000000
-        elif minimum_switch_xml.attrib['unit'] == 'us':
-            minimum_switch *= 1000
-        else:
-            raise TypeError('I do not know this unit for the minimum time for a frame in a switch => '
-                            + minimum_switch_xml.attrib['unit'])
-        minimum_switch = (int(minimum_switch))
-
-        return minimum_switch
+        # Read the time and change its unit to fit us
+        return Network.__get_topology_time_from_xml(name, index_network, 'MinTimeSwitch', index_minimum_switch,
+                                                    'minimum time for a frame in a switch')
 
     @staticmethod
     def get_maximum_time_switch_from_xml(name, index_network, index_maximum_switch):
@@ -1088,39 +1197,12 @@ class Network:
         :param index_maximum_switch: maximum time in switch index
         :return: the interval arrival time
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
-        # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        maximum_switch_xml = topology_information_xml.findall('MaxTimeSwitch')[index_maximum_switch]
-        maximum_switch = int(maximum_switch_xml.text)
-        # Check the unit and change to fit us
-        if maximum_switch_xml.attrib['unit'] == 'ms':
-            maximum_switch *= 1000000
-        elif maximum_switch_xml.attrib['unit'] == 'ns':
-            maximum_switch = maximum_switch
-        elif maximum_switch_xml.attrib['unit'] == 's':
-            maximum_switch *= 1000000000
-        elif maximum_switch_xml.attrib['unit'] == 'us':
-            maximum_switch *= 1000
-        else:
-            raise TypeError('I do not know this unit for the maximum time for a frame in a switch => '
-                            + maximum_switch_xml.attrib['unit'])
-        maximum_switch = (int(maximum_switch))
-
-        return maximum_switch
+        # Read the time and change its unit to fit us
+        return Network.__get_topology_time_from_xml(name, index_network, 'MaxTimeSwitch', index_maximum_switch,
+                                                    'maximum time for a frame in a switch')
 
     @staticmethod
     def get_sensing_control_period_from_xml(name, index_network, index_sensing_control_period):
-
         """
         Get the sensing and control period from the configuration file for the given network
         :param name: configuration file name
@@ -1128,36 +1210,9 @@ class Network:
         :param index_sensing_control_period: sensing and control period index
         :return: the interval arrival time
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
-        # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        sensing_control_period_xml = \
-            topology_information_xml.findall('SensingControlPeriod')[index_sensing_control_period]
-        sensing_control_period = int(sensing_control_period_xml.text)
-        # Check the unit and change to fit us
-        if sensing_control_period_xml.attrib['unit'] == 'ms':
-            sensing_control_period *= 1000000
-        elif sensing_control_period_xml.attrib['unit'] == 'ns':
-            sensing_control_period = sensing_control_period
-        elif sensing_control_period_xml.attrib['unit'] == 's':
-            sensing_control_period *= 1000000000
-        elif sensing_control_period_xml.attrib['unit'] == 'us':
-            sensing_control_period *= 1000
-        else:
-            raise TypeError('I do not know this unit for the sensing and control period => '
-                            + sensing_control_period_xml.attrib['unit'])
-        sensing_control_period = (int(sensing_control_period))
-
-        return sensing_control_period
+        # Read the time and change its unit to fit us
+        return Network.__get_topology_time_from_xml(name, index_network, 'SensingControlPeriod',
+                                                    index_sensing_control_period, 'sensing and control period')
 
     @staticmethod
     def get_sensing_control_time_from_xml(name, index_network, index_sensing_control_time):
@@ -1168,36 +1223,9 @@ class Network:
         :param index_sensing_control_time: sensing and control time index
         :return: the interval arrival time
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
-
-        # Position the branch to the network that is going to be read
-        network_description_xml = root.findall('NetworkGenerator/Topology')[index_network]  # Select the network
-
-        # Read the policy and return it
-        topology_information_xml = network_description_xml.find('TopologyInformation')
-        sensing_control_time_xml = \
-            topology_information_xml.findall('SensingControlTime')[index_sensing_control_time]
-        sensing_control_time = int(sensing_control_time_xml.text)
-        # Check the unit and change to fit us
-        if sensing_control_time_xml.attrib['unit'] == 'ms':
-            sensing_control_time *= 1000000
-        elif sensing_control_time_xml.attrib['unit'] == 'ns':
-            sensing_control_time = sensing_control_time
-        elif sensing_control_time_xml.attrib['unit'] == 's':
-            sensing_control_time *= 1000000000
-        elif sensing_control_time_xml.attrib['unit'] == 'us':
-            sensing_control_time *= 1000
-        else:
-            raise TypeError('I do not know this unit for the sensing and control time => '
-                            + sensing_control_time_xml.attrib['unit'])
-        sensing_control_time = (int(sensing_control_time))
-
-        return sensing_control_time
+        # Read the time and change its unit to fit us
+        return Network.__get_topology_time_from_xml(name, index_network, 'SensingControlTime',
+                                                    index_sensing_control_time, 'sensing and control time')
 
     @staticmethod
     def get_traffic_information_from_xml(name, index_traffic):
@@ -1207,15 +1235,10 @@ class Network:
         :param index_traffic: number of the traffic information
         :return: the number of frames, percentage of single, local, multiple and broadcast, in this order
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        root = Network.__read_xml(name)  # Open the file if exists, it is only parsed the first time
 
         # Position the branch to the traffic that is going to be read
-        traffic_information_xml = root.findall('NetworkGenerator/Traffic/TrafficInformation')[index_traffic]
+        traffic_information_xml = Network.__find_xml(root, 'NetworkGenerator/Traffic/TrafficInformation', index_traffic)
 
         # Read the information and save it in local variables to return later
         num_frames = int(traffic_information_xml.find('NumberFrames').text)
@@ -1235,15 +1258,11 @@ class Network:
         :param index_frames_description: number of the frame description
         :return: list with all periods, percentages, deadlines and sizes in this order
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        root = Network.__read_xml(name)  # Open the file if exists, it is only parsed the first time
 
         # Position the branch to the traffic that is going to be read
-        frames_description_xml = root.findall('NetworkGenerator/Traffic/FrameDescription')[index_frames_description]
+        frames_description_xml = Network.__find_xml(root, 'NetworkGenerator/Traffic/FrameDescription',
+                                                    index_frames_description)
 
         # Init lists of variables to return
         periods = []
@@ -1257,38 +1276,14 @@ class Network:
             per_periods.append(float(frame_type_xml.find('Percentage').text))
 
             period_xml = frame_type_xml.find('Period')
-            period = int(period_xml.text)
-            # Check the unit and change the period to fit us
-            if period_xml.attrib['unit'] == 'ms':
-                period *= 1000000
-            elif period_xml.attrib['unit'] == 'ns':
-                period = period
-            elif period_xml.attrib['unit'] == 's':
-                period *= 1000000000
-            elif period_xml.attrib['unit'] == 'us':
-                period *= 1000
-            else:
-                raise TypeError('I do not know this unit for the period => ' + period_xml.attrib['unit'])
-            periods.append(int(period))
+            periods.append(Network.__convert_time_xml(period_xml, 'period'))  # Change the unit of the period to ns
 
             if frame_type_xml.find('Deadline') is None:  # If there is no deadline, add None
                 deadlines.append(None)
             else:
                 # Check the unit and change the period to fit us
                 deadline_xml = frame_type_xml.find('Deadline')
-                deadline = int(deadline_xml.text)
-                # Check the unit and change the period to fit us
-                if deadline_xml.attrib['unit'] == 'ms':
-                    deadline *= 1000000
-                elif deadline_xml.attrib['unit'] == 'ns':
-                    deadline = deadline
-                elif deadline_xml.attrib['unit'] == 's':
-                    deadline *= 1000000000
-                elif deadline_xml.attrib['unit'] == 'us':
-                    deadline *= 1000
-                else:
-                    raise TypeError('I do not know this unit for the deadline => ' + deadline_xml.attrib['unit'])
-                deadlines.append(int(deadline))
+                deadlines.append(Network.__convert_time_xml(deadline_xml, 'deadline'))  # Change the unit to ns
 
             if frame_type_xml.find('Size') is None:  # If there is no size, add None
                 sizes.append(None)
@@ -1314,15 +1309,11 @@ class Network:
         deadline, the waiting percentage, the deadline percentage and the waiting/deadline together percentage, in 
         order
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        root = Network.__read_xml(name)  # Open the file if exists, it is only parsed the first time
 
         # Position the branch to the dependency parameters that is going to be read
-        dependencies_parameter_xml = root.findall('NetworkGenerator/Traffic/Dependencies')[index_dependencies]
+        dependencies_parameter_xml = Network.__find_xml(root, 'NetworkGenerator/Traffic/Dependencies',
+                                                        index_dependencies)
 
         # Read all the variables and save them in local variables to be returned
         num_dependencies = int(dependencies_parameter_xml.find('NumberDependencies').text)
@@ -1332,68 +1323,20 @@ class Network:
         max_children = int(dependencies_parameter_xml.find('MaxChildren').text)
 
         min_time_waiting_xml = dependencies_parameter_xml.find('MinTimeWaiting')
-        min_time_waiting = int(min_time_waiting_xml.text)
-        # Check the unit and change to fit us
-        if min_time_waiting_xml.attrib['unit'] == 'ms':
-            min_time_waiting *= 1000000
-        elif min_time_waiting_xml.attrib['unit'] == 'ns':
-            min_time_waiting = min_time_waiting
-        elif min_time_waiting_xml.attrib['unit'] == 's':
-            min_time_waiting *= 1000000000
-        elif min_time_waiting_xml.attrib['unit'] == 'us':
-            min_time_waiting *= 1000
-        else:
-            raise TypeError('I do not know this unit for the minimum time waiting => '
-                            + min_time_waiting_xml.attrib['unit'])
-        min_time_waiting = (int(min_time_waiting))
+        # Check the unit and change it to fit us
+        min_time_waiting = Network.__convert_time_xml(min_time_waiting_xml, 'minimum time waiting')
 
         max_time_waiting_xml = dependencies_parameter_xml.find('MaxTimeWaiting')
-        max_time_waiting = int(max_time_waiting_xml.text)
-        # Check the unit and change to fit us
-        if max_time_waiting_xml.attrib['unit'] == 'ms':
-            max_time_waiting *= 1000000
-        elif max_time_waiting_xml.attrib['unit'] == 'ns':
-            max_time_waiting = max_time_waiting
-        elif max_time_waiting_xml.attrib['unit'] == 's':
-            max_time_waiting *= 1000000000
-        elif max_time_waiting_xml.attrib['unit'] == 'us':
-            max_time_waiting *= 1000
-        else:
-            raise TypeError('I do not know this unit for the maximum time waiting => '
-                            + max_time_waiting_xml.attrib['unit'])
-        max_time_waiting = (int(max_time_waiting))
+        # Check the unit and change it to fit us
+        max_time_waiting = Network.__convert_time_xml(max_time_waiting_xml, 'maximum time waiting')
 
         min_time_deadline_xml = dependencies_parameter_xml.find('MinTimeDeadline')
-        min_time_deadline = int(min_time_deadline_xml.text)
-        # Check the unit and change to fit us
-        if min_time_deadline_xml.attrib['unit'] == 'ms':
-            min_time_deadline *= 1000000
-        elif min_time_deadline_xml.attrib['unit'] == 'ns':
-            min_time_deadline = min_time_deadline
-        elif min_time_deadline_xml.attrib['unit'] == 's':
-            min_time_deadline *= 1000000000
-        elif min_time_deadline_xml.attrib['unit'] == 'us':
-            min_time_deadline *= 1000
-        else:
-            raise TypeError('I do not know this unit for the minimum time deadline => '
-                            + min_time_deadline_xml.attrib['unit'])
-        min_time_deadline = (int(min_time_deadline))
+        # Check the unit and change it to fit us
+        min_time_deadline = Network.__convert_time_xml(min_time_deadline_xml, 'minimum time deadline')
 
         max_time_deadline_xml = dependencies_parameter_xml.find('MaxTimeDeadline')
-        max_time_deadline = int(max_time_deadline_xml.text)
-        # Check the unit and change to fit us
-        if max_time_deadline_xml.attrib['unit'] == 'ms':
-            max_time_deadline *= 1000000
-        elif max_time_deadline_xml.attrib['unit'] == 'ns':
-            max_time_deadline = max_time_deadline
-        elif max_time_deadline_xml.attrib['unit'] == 's':
-            max_time_deadline *= 1000000000
-        elif max_time_deadline_xml.attrib['unit'] == 'us':
-            max_time_deadline *= 1000
-        else:
-            raise TypeError('I do not know this unit for the maximum time deadline => '
-                            + max_time_deadline_xml.attrib['unit'])
-        max_time_deadline = (int(max_time_deadline))
+        # Check the unit and change it to fit us
+        max_time_deadline = Network.__convert_time_xml(max_time_deadline_xml, 'maximum time deadline')
 
         waiting = float(dependencies_parameter_xml.find('Waiting').text)
         deadline = float(dependencies_parameter_xml.find('Deadline').text)
@@ -1414,6 +1357,12 @@ class Network:
         # Create the node to attach all the network description
         network_description_xml = Xml.SubElement(top, 'NetworkDescription')
 
+        # Find the links connected to every node at once, in the order of the links list
+        connections = [[] for _ in range(self.__num_nodes)]
+        for link_index, link in enumerate(self.__links):
+            connections[link[0]].append(link_index)
+            connections[link[1]].append(link_index)
+
         # For all nodes, attach its information
         nodes_xml = Xml.SubElement(network_description_xml, 'Nodes')
         for index, node in self.__graph.nodes_iter(data=True):
@@ -1430,9 +1379,8 @@ class Network:
 
             # Add the links connected to that node
             connections_xml = Xml.SubElement(node_xml, 'Connections')
-            for link in self.__links:
-                if link[0] == index or link[1] == index:    # If the link is connected to the node, add its ID
-                    Xml.SubElement(connections_xml, 'Link').text = str(self.__links.index(link))
+            for link_index in connections[index]:           # For all links connected to the node, add its ID
+                Xml.SubElement(connections_xml, 'Link').text = str(link_index)
 
         # For all links, attach its information
         links_xml = Xml.SubElement(network_description_xml, 'Links')
@@ -1564,12 +1512,7 @@ class Network:
         :param name: name of the configuration xml file
         :return: 
         """
-        # Open the file if exists
-        try:
-            tree = Xml.parse(name)
-        except:
-            raise Exception("Could not read the xml file")
-        root = tree.getroot()
+        root = self.__read_xml(name)  # Open the file if exists, it is only parsed the first time
 
         # Create the folder "networks", if already exists, delete it and create it empty again
         try:
@@ -1599,14 +1542,16 @@ class Network:
         sensing_control_time_null = False
 
         conf = NetworkConfiguration()
-        list_unique_conf = []           # List of all unique configurations
+        list_unique_conf = []           # List of all unique configurations (preallocated per topology)
+        num_unique_conf = 0             # Number of unique configurations already saved in the list
+        unique_conf_keys = set()        # Keys of all unique configurations to check if a configuration is repeated
 
         # For all topologies found in the configuration file, read the number of different configurations
         for topology_index in range(num_topologies):
             # Get the network description for the topology
 
             # Get the number of different configurations for that topology
-            topology_xml = root.findall('NetworkGenerator/Topology')[topology_index]
+            topology_xml = self.__find_xml(root, 'NetworkGenerator/Topology', topology_index)
             topology_information_xml = topology_xml.find('TopologyInformation')
 
             num_replicas = len(topology_information_xml.findall('NumberReplicas'))
@@ -1641,6 +1586,12 @@ class Network:
                 num_sensing_control_time = 1
                 sensing_control_time_null = True
 
+            # Preallocate the list of unique configurations with the maximum number of configurations of the topology
+            list_unique_conf.extend([None] * (num_traffic_information * num_frame_descriptions *
+                                              max(num_dependencies_configurations, 1) * num_replicas * num_policies *
+                                              num_intervals * num_minimum_switch * num_maximum_switch *
+                                              num_sensing_control_period * num_sensing_control_time))
+
             for traffic_information_index in range(num_traffic_information):
                 for frame_description_index in range(num_frame_descriptions):
                     # If there is no configuration, we enter the for, but we do not extract anything from the
@@ -1754,9 +1705,13 @@ class Network:
                                                         conf.formalize_configuration()
 
                                                         # Add the configuration if there is no same configuration
-                                                        if conf not in list_unique_conf:
-                                                            list_unique_conf.append(deepcopy(conf))
+                                                        conf_key = conf.get_key()
+                                                        if conf_key not in unique_conf_keys:
+                                                            unique_conf_keys.add(conf_key)
+                                                            list_unique_conf[num_unique_conf] = deepcopy(conf)
+                                                            num_unique_conf += 1
 
+        list_unique_conf = list_unique_conf[:num_unique_conf]    # Remove the unused preallocated positions
         logging.debug("Number of total networks => %d", total_networks)
         logging.debug("Number of unique networks = > %d", len(list_unique_conf))
 
@@ -1820,4 +1775,4 @@ class Network:
                 name_network = "networks/" + str(hash_num.hexdigest()) + "/" + str(hash_num.hexdigest())
                 self.__generate_xml_output(name_network, configuration)
 
-        logging.debug(logging.debug("Number of schedulable networks = > %d", schedulable_networks))
+        logging.debug("Number of schedulable networks = > %d", schedulable_networks)
@@ -17,12 +17,8 @@ class DependencyNode:
 
     # Variable definitions #
 
-    __frame_index = None
-    __link_index = None
-    __waiting = None
-    __deadline = None
-    __children = []
-    __parent = None
+    # The variables are declared in slots, so the nodes do not need a dictionary for their attributes
+    __slots__ = ('__frame_index', '__link_index', '__waiting', '__deadline', '__children', '__parent')
 
     # Standard function definitions #
 
@@ -41,15 +37,34 @@ class DependencyNode:
         :param link_index: link index
         :param waiting: waiting time
         :param deadline: deadline time
-        :return: 
+        :return: the new children
+        :rtype: DependencyNode
         """
         self.__children.append(DependencyNode(frame_index, link_index, waiting, deadline, self))
+        return self.__children[-1]
+
+    def search_dependency(self, frame_index, link_index):
+        """
+        Search with a stack the first dependency node with the frame and link in the tree
+        :param frame_index: frame index
+        :param link_index: link index
+        :return: dependency node, None if not found
+        :rtype: DependencyNode
+        """
+        # Walk the tree in the same order as the recursion did, the children are pushed reversed so the first
+        # child is the next one to be visited
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__frame_index == frame_index and node.__link_index == link_index:   # We found it
+                return node
+            stack.extend(reversed(node.__children))     # If not, visit all the children of the dependency
+        return None
 
     def search_and_add_dependency(self, predecessor_frame, predecessor_link, successor_frame, successor_link, waiting,
                                   deadline):
         """
-        Search recursively if the predecessor frame and index appear in the tree, if yes, add a new children 
-        and return 1, else 0
+        Search if the predecessor frame and index appear in the tree, if yes, add a new children and return 1, else 0
         :param predecessor_frame: predecessor frame index
         :param predecessor_link: predecessor frame link
         :param successor_frame: successor frame index
@@ -58,34 +73,28 @@ class DependencyNode:
         :param deadline: deadline time
         :return: 1 if found and added, 0 otherwise
         """
-        # If the current dependency is the predecessor, add a new children
-        if self.__frame_index == predecessor_frame and self.__link_index == predecessor_link:
-            self.add_new_children(successor_frame, successor_link, waiting, deadline)
+        # If the predecessor is in the tree, add a new children
+        predecessor = self.search_dependency(predecessor_frame, predecessor_link)
+        if predecessor is not None:
+            predecessor.add_new_children(successor_frame, successor_link, waiting, deadline)
             return 1            # Return that we found it
-        else:   # If not, iterate over all the children of the dependency
-            for child in self.__children:
-                found = child.search_and_add_dependency(predecessor_frame, predecessor_link, successor_frame,
-                                                        successor_link, waiting, deadline)
-                if found:       # If we found it, return 1 to go back
-                    return 1
         return 0
 
     def get_dependency_by_predecessor_frame(self, frame_index):
         """
-        Recursion that returns the dependency node by predecessor frame
+        Search with a stack the dependency node by predecessor frame
         :param frame_index: predecessor frame on the dependency
         :type frame_index: int
         :return: dependency node
         :rtype: DependencyNode
         """
-        # If the current dependency is the predecessor, we found it
-        if self.__frame_index == frame_index:
-            return self
-        else:  # If not, iterate over all the children of the dependency
-            for child in self.__children:
-                found = child.get_dependency_by_predecessor_frame(frame_index)
-                if found:       # If we found it, return 1 to go back
-                    return found
+        # Walk the tree in the same order as the recursion did
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__frame_index == frame_index:   # If the current dependency is the predecessor, we found it
+                return node
+            stack.extend(reversed(node.__children))     # If not, visit all the children of the dependency
         return None             # If not, None
 
     def get_parent(self):
@@ -146,12 +155,26 @@ class DependencyTree:
 
     # Variable definitions #
 
-    __list_trees = []
+    # The variables are declared in slots and only initialized for every tree, so no list is shared between them
+    __slots__ = ('__list_trees',
+                 '__nodes',             # Dictionary from (frame index, link index) to the list of nodes with them
+                 '__frame_nodes')       # Dictionary from the frame index to the list of nodes with it
 
     # Standard function definitions #
 
     def __init__(self):
         self.__list_trees = []
+        self.__nodes = {}
+        self.__frame_nodes = {}
+
+    def __add_to_index(self, node):
+        """
+        Save the node in the dictionaries to find it without searching the trees
+        :param node: dependency node
+        :return:
+        """
+        self.__nodes.setdefault((node.get_frame_index(), node.get_link_index()), []).append(node)
+        self.__frame_nodes.setdefault(node.get_frame_index(), []).append(node)
 
     def add_dependency(self, predecessor_frame, predecessor_link, successor_frame, successor_link, waiting, deadline):
         """
@@ -164,16 +187,21 @@ class DependencyTree:
         :param deadline: deadline time
         :return: 
         """
-        if self.__list_trees:                      # If there are already dependencies in the tree
+        # Find the predecessor in the dictionary, only if more than one node has its frame and link the trees are
+        # searched, so the first one of them in the trees is selected
+        nodes = self.__nodes.get((predecessor_frame, predecessor_link), ())
+        if len(nodes) == 1:
+            predecessor = nodes[0]
+        elif nodes:
             for tree in self.__list_trees:
-                found = tree.search_and_add_dependency(predecessor_frame, predecessor_link, successor_frame,
-                                                       successor_link, waiting, deadline)
-                if found:                           # if we found it, stop the search
-                    return
-
-        # If we did not found anything or the list of trees is empty, add a new tree, and a child to it
-        self.__list_trees.append(DependencyNode(predecessor_frame, predecessor_link, 0, 0))
-        self.__list_trees[-1].add_new_children(successor_frame, successor_link, waiting, deadline)
+                predecessor = tree.search_dependency(predecessor_frame, predecessor_link)
+                if predecessor is not None:         # if we found it, stop the search
+                    break
+        else:   # If we did not found anything or the list of trees is empty, add a new tree, and a child to it
+            predecessor = DependencyNode(predecessor_frame, predecessor_link, 0, 0)
+            self.__list_trees.append(predecessor)
+            self.__add_to_index(predecessor)
+        self.__add_to_index(predecessor.add_new_children(successor_frame, successor_link, waiting, deadline))
 
     def get_dependency_by_frame(self, frame_index):
         """
@@ -183,6 +211,10 @@ class DependencyTree:
         :return: dependency node
         :rtype: DependencyNode
         """
+        # Find it in the dictionary, the trees are only searched if more than one node has the frame
+        nodes = self.__frame_nodes.get(frame_index, ())
+        if len(nodes) <= 1:
+            return nodes[0] if nodes else None
         for tree in self.__list_trees:          # Search in all dependency trees
             found = tree.get_dependency_by_predecessor_frame(frame_index)
             if found:
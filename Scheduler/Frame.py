@@ -13,7 +13,7 @@
  *                                                                                                                     *
  * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * """
 
-from itertools import chain
+from itertools import islice
 from z3 import *
 
 
@@ -24,12 +24,10 @@ class TreePath:
 
     # Variable definitions #
 
-    __link_id = None
-    __transmission_time = None
-    __offset = []
-    __name_offset = []
-    __parent = None
-    __children = []
+    # The variables are declared in slots, so the tree paths do not need a dictionary for their attributes
+    __slots__ = ('__link_id', '__transmission_time', '__offset', '__name_offset', '__parent', '__children',
+                 '__children_links',    # Dictionary from the link id to the child path with it
+                 '__preorder')          # List with the pre-traversal of the tree path, None until it is needed
 
     # Standard function definitions #
 
@@ -40,15 +38,32 @@ class TreePath:
         self.__name_offset = []
         self.__parent = None
         self.__children = []
+        self.__children_links = {}
+        self.__preorder = None
 
     def __iter__(self):
         """
-        Modified iterator that does a pre-traversal of the tree path
+        Modified iterator that does a pre-traversal of the tree path, the traversal is saved until the tree changes
         :return: current path
         """
-        yield self
-        for v in chain(*map(iter, self.__children)):
-            yield v
+        if self.__preorder is None:
+            self.__preorder = []
+            stack = [self]
+            while stack:  # The children are pushed reversed, so the first child is the next one to be visited
+                path = stack.pop()
+                self.__preorder.append(path)
+                stack.extend(reversed(path.__children))
+        return iter(self.__preorder)
+
+    def __clear_preorder(self):
+        """
+        Clear the saved pre-traversal of the path and all its parents, as their trees have changed
+        :return:
+        """
+        path = self
+        while path is not None:
+            path.__preorder = None
+            path = path.__parent
 
     def get_link_id(self):
         """
@@ -103,12 +118,9 @@ class TreePath:
         :param num_replicas: number of replicas (depends of the replicas of the collision domain)
         :return: 
         """
-        for _ in range(num_instances):
-            self.__offset.append([])
-            self.__name_offset.append([])
-            for __ in range(num_replicas):
-                self.__offset[-1].append(None)
-                self.__name_offset[-1].append(None)
+        # Add a row of empty replicas for every instance, each row is created at once instead of appending its values
+        self.__offset.extend([None] * num_replicas for _ in range(num_instances))
+        self.__name_offset.extend([None] * num_replicas for _ in range(num_instances))
 
     def get_children(self):
         """
@@ -124,6 +136,9 @@ class TreePath:
         :return: 
         """
         self.__children = list_paths
+        self.__clear_preorder()
+        # Index the new children by their link id, keeping the first child if more than one has the same link
+        self.__children_links = {child.get_link_id(): child for child in reversed(list_paths)}
 
     def get_child(self, index_child):
         """
@@ -141,6 +156,8 @@ class TreePath:
         :return: 
         """
         self.__children[index_child] = child_path
+        self.__clear_preorder()
+        self.__children_links = {child.get_link_id(): child for child in reversed(self.__children)}
 
     def set_offset(self, index_instance, index_replica, time):
         """
@@ -197,28 +214,25 @@ class TreePath:
 
     def add_new_path(self, path):
         """
-        If the link in the path is on children, continue recursion, if not, create new children and continue until the
-        path is empty
+        Walk the children that have the links of the path, and create new children for the links that are not yet in
+        the tree path
         :param path: list of index links in the path
         :return: 
         """
-        if self.__link_id is None:  # If the link id is None, this link has not appear
-            self.__link_id = path[0]  # We create it adding the link id
-            path = path[1:]  # Advance the path
-            if path:  # If there are more links in the path
-                self.__children.append(TreePath())  # Add it as new children
-                self.__children[-1].set_parent(self)  # Set the actual path as parent of the child
-                self.__children[-1].add_new_path(path)  # Continue the recursion
-        elif len(path) > 1:  # If the path is larger than 1 (if 1, we finished!)
-            child_found = False
-            for child in self.__children:  # Search if any children has the next link in the path
-                if child.get_link_id() == path[1]:  # If it has, continue the recursion with the child path
-                    child.add_new_path(path[1:])
-                    child_found = True
-                    break
-            if not child_found:  # If the link is not in a child create it
-                self.__children.append(TreePath())
-                self.__children[-1].add_new_path(path[1:])  # Call recursion, it will create add the information
+        node = self
+        if node.__link_id is None:  # If the link id is None, this link has not appear
+            node.__link_id = path[0]  # We create it adding the link id
+
+        for link_id in islice(path, 1, None):  # For the rest of links in the path, search the child that has it
+            child = node.__children_links.get(link_id)
+            if child is None:  # If the link is not in a child create it
+                node.__clear_preorder()  # The tree changes, so the saved traversals of the path and its parents too
+                child = TreePath()
+                child.__link_id = link_id
+                child.__parent = node  # Set the actual path as parent of the child
+                node.__children.append(child)
+                node.__children_links[link_id] = child
+            node = child  # Continue with the child path
 
     def get_num_replicas(self):
         """
@@ -261,11 +275,8 @@ class Frame:
 
     # Variable definitions #
 
-    __period = None
-    __deadline = None
-    __size = None
-    __tree_path = None
-    __splits = []
+    # The variables are declared in slots, so the frames do not need a dictionary for their attributes
+    __slots__ = ('__period', '__deadline', '__size', '__tree_path', '__splits')
 
     # Standard function definitions #
 
@@ -355,21 +366,32 @@ class Frame:
         """
         self.__splits.append(split)
 
-    def update_frame(self, links, hyper_period, list_replicas, collision_domains):
+    def update_frame(self, links, hyper_period, list_replicas, collision_domains, link_collision_domains=None):
         """
         Init the frame to be prepared to allocate all instances and replicas of frames (init offsets and time)
         :param links: list of links objects of the network that contains information of the speed
         :param hyper_period: hyper period of the network
         :param list_replicas: list of replicas for every collision domain
         :param collision_domains: matrix with the links in every collision domain
+        :param link_collision_domains: dictionary from the link index to its first collision domain, built from the
+        collision domains if not given
         :return: 
         """
+        if link_collision_domains is None:  # Index the collision domain of every link, the first one is kept
+            link_collision_domains = {}
+            for index, collision_domain in enumerate(collision_domains):
+                for link in collision_domain:
+                    link_collision_domains.setdefault(link, index)
+
+        num_instances = int(hyper_period / self.__period)  # Get the number of instances, the same for all paths
+        size = self.__size * 1000  # Size used for the transmission time in all the links
+
         for path in self.__tree_path:  # For every path in the tree path, update the time and the offsets
-            path.set_transmission_time((self.__size * 1000) / links[path.get_link_id()].get_speed())
-            num_instances = int(hyper_period / self.__period)  # Get the number of instances
+            link_id = path.get_link_id()
+            path.set_transmission_time(size / links[link_id].get_speed())
 
             # Get the list of replicas if the link is in a collision domain + 1, 1 if not
-            collision_domain = [index for index, row in enumerate(collision_domains) if path.get_link_id() in row]
-            num_replicas = 1 if not collision_domain else list_replicas[collision_domain[0]] + 1
+            collision_domain = link_collision_domains.get(link_id)
+            num_replicas = 1 if collision_domain is None else list_replicas[collision_domain] + 1
 
             path.init_offset(num_instances, num_replicas)
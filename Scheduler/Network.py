@@ -35,6 +35,7 @@ class Network:
     __num_links = None
     __links = []
     __collision_domains = []
+    __link_collision_domains = {}       # Dictionary from the link index to its (first) collision domain index
     __num_dependencies = None
     __dependencies = None
     __sensing_control_period = None
@@ -57,6 +58,7 @@ class Network:
         self.__num_links = None
         self.__links = []
         self.__collision_domains = []
+        self.__link_collision_domains = {}
         self.__num_dependencies = None
         self.__dependencies = None
         self.__sensing_control_period = None
@@ -79,8 +81,14 @@ class Network:
         :param collision_domains: matrix with the links in every collision domain
         :return: 
         """
+        # Index the collision domain of every link once for all the frames, the first collision domain is kept
+        link_collision_domains = {}
+        for index, collision_domain in enumerate(collision_domains):
+            for link in collision_domain:
+                link_collision_domains.setdefault(link, index)
+
         for frame in self.__frames:            # For all frames, init correctly its information
-            frame.update_frame(links, hyper_period, list_replicas, collision_domains)
+            frame.update_frame(links, hyper_period, list_replicas, collision_domains, link_collision_domains)
 
     def get_number_frames(self):
         """
@@ -259,10 +267,7 @@ class Network:
         :return: index of the collision domain if link is inside, None otherwise
         :rtype: int, None
         """
-        for index, collision_domain in enumerate(self.__collision_domains):
-            if link_index in collision_domain:
-                return index
-        return -1
+        return self.__link_collision_domains.get(link_index, -1)     # The links are indexed when read
 
     def get_dependencies(self):
         """
@@ -367,10 +372,10 @@ class Network:
         collision_domains_xml = root.findall('NetworkDescription/CollisionDomains/CollisionDomain')
         for collision_domain_xml in collision_domains_xml:          # For all collision domains
             links_xml = collision_domain_xml.findall('Link')
-            links = []
-            for link_xml in links_xml:                              # For all links save it on the links list
-                links.append(int(link_xml.text))
-            self.__collision_domains.append(links)                  # Add the list to the collision domain
+            links = tuple(int(link_xml.text) for link_xml in links_xml)  # Save all links in a tuple
+            self.__collision_domains.append(links)                  # Add the tuple to the collision domain
+            for link in links:      # Index the links, if a link is in more than one, the first collision domain is kept
+                self.__link_collision_domains.setdefault(link, len(self.__collision_domains) - 1)
 
     def __get_frames_information_xml(self, filename):
         """